@@ -4,13 +4,47 @@ Script to generate a static web page showing rustedbytes projects.
 Fetches information from GitHub repositories and crates.io.
 """
 
+import asyncio
+import functools
+import hashlib
+import io
 import os
+import random
+import re
 import sys
+import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 import requests
 import yaml
+from dataclasses import dataclass
 from datetime import datetime
+from string import Template
 from typing import List, Dict, Optional
+from urllib3.util import Retry
+
+# orjson decodes the large GitHub/crates.io payloads 2-3x faster than
+# the stdlib json module; fall back gracefully when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The C-accelerated YAML loader parses several times faster than the
+# pure-Python one; not every PyYAML build ships it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Advertise compression so GitHub and crates.io send ~5x smaller
+# payloads; only offer brotli when a decoder is actually installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
 
 # Configuration
 GITHUB_USER = "mad4j"
@@ -18,6 +52,42 @@ REPO_PREFIX = "rustedbytes"
 GITHUB_API_BASE = "https://api.github.com"
 CRATES_API_BASE = "https://crates.io/api/v1"
 
+# Bound the number of concurrent API requests to stay well within the
+# rate limits; crates.io gets a tighter bound per its crawler policy
+MAX_CONCURRENT_REQUESTS = 8
+MAX_CONCURRENT_CRATES_REQUESTS = 4
+
+# Persistent HTTP response cache (ETag-based conditional requests)
+CACHE_FILE = os.path.join(".cache", "http_cache.json")
+
+# Digest of the project data behind the last generated page, used to
+# skip regeneration when nothing upstream changed
+HASH_FILE = os.path.join(".cache", "last_hash")
+
+# Retry policy for transient failures and rate limiting
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 1.5
+RETRYABLE_STATUSES = [429, 502, 503, 504]
+
+# Shared session so TCP/TLS connections are pooled across all synchronous
+# requests instead of re-handshaking per call (aiohttp pools on its own)
+SESSION = requests.Session()
+SESSION.headers.update({
+    "Accept": "application/vnd.github.v3+json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
+SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRYABLE_STATUSES,
+        respect_retry_after_header=True,
+        allowed_methods=frozenset({"GET", "POST"}),
+    ),
+))
+
 # Default page configuration
 DEFAULT_PAGE_CONFIG = {
     "layout": "default",
@@ -35,21 +105,84 @@ def get_github_token() -> Optional[str]:
     return os.environ.get("GITHUB_TOKEN")
 
 
+def load_http_cache(cache_file: str = CACHE_FILE) -> Dict:
+    """Load the persistent HTTP response cache from disk.
+
+    The cache maps request URLs to {"etag": ..., "body": ...} entries so
+    that subsequent runs can issue conditional If-None-Match requests.
+    GitHub answers those with 304 Not Modified without counting them
+    against the rate limit.
+    """
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_http_cache(cache: Dict, cache_file: str = CACHE_FILE) -> None:
+    """Persist the HTTP response cache to disk."""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Warning: Could not save HTTP cache: {e}", file=sys.stderr)
+
+
+def _read_last_hash(hash_file: str = HASH_FILE) -> Optional[str]:
+    """Read the digest of the project data behind the last generated page."""
+    try:
+        with open(hash_file, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_last_hash(digest: str, hash_file: str = HASH_FILE) -> None:
+    """Persist the digest of the project data behind the generated page."""
+    try:
+        os.makedirs(os.path.dirname(hash_file), exist_ok=True)
+        with open(hash_file, "w", encoding="utf-8") as f:
+            f.write(digest)
+    except OSError as e:
+        print(f"Warning: Could not save data digest: {e}", file=sys.stderr)
+
+
+def _loads(data: bytes):
+    """Decode a JSON payload, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _cache_key(url: str, params: Optional[Dict] = None) -> str:
+    """Build a stable cache key for a URL and optional query parameters."""
+    if params:
+        query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        return f"{url}?{query}"
+    return url
+
+
+@functools.lru_cache(maxsize=1)
 def load_page_config(config_path: str = "page_config.yml") -> Dict:
     """Load page configuration from YAML file or environment variables.
-    
+
+    The parsed configuration is memoized, so repeated calls (e.g. from
+    tests) do not re-read and re-parse the YAML file.
+
     Environment variables take precedence over config file:
     - PAGE_LAYOUT: Override the layout setting
     - PAGE_THEME: Override the theme setting
     - PAGE_TITLE: Override the page title
     """
     config = DEFAULT_PAGE_CONFIG.copy()
-    
+
     # Try to load from YAML file
     if os.path.exists(config_path):
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                file_config = yaml.safe_load(f)
+                file_config = yaml.load(f, Loader=YamlLoader)
                 if file_config:
                     # Deep merge the configuration
                     config.update(file_config)
@@ -70,74 +203,327 @@ def load_page_config(config_path: str = "page_config.yml") -> Dict:
     return config
 
 
-def fetch_repos_with_prefix(user: str, prefix: str, token: Optional[str] = None) -> List[Dict]:
-    """Fetch all repositories for a user that match the prefix."""
+@dataclass(slots=True)
+class Repo:
+    """Normalized repository metadata shared by the REST and GraphQL paths.
+
+    Attribute access on a slotted dataclass replaces the repeated dict
+    subscripting the rest of the pipeline would otherwise do per repo.
+    """
+    name: str
+    description: Optional[str]
+    html_url: str
+    language: Optional[str] = None
+    has_cargo_toml: Optional[bool] = None
+    latest_release: Optional[Dict] = None
+    # True when the release was already fetched (GraphQL path), even if
+    # the repo turned out to have no releases
+    release_prefetched: bool = False
+
+
+def _repo_from_rest(data: Dict) -> Repo:
+    """Map a REST API repository object into a Repo."""
+    return Repo(
+        name=data["name"],
+        description=data["description"],
+        html_url=data["html_url"],
+        language=data.get("language"),
+    )
+
+
+def fetch_repos_with_prefix(user: str, prefix: str, token: Optional[str] = None,
+                            cache: Optional[Dict] = None) -> List[Repo]:
+    """Fetch all repositories for a user that match the prefix.
+
+    Tries the Search API first so GitHub filters by name server-side,
+    usually in a single page; falls back to paging through all of the
+    user's repositories when search fails (it has a separate, lower
+    rate limit).
+    """
     headers = {"Accept": "application/vnd.github.v3+json"}
     if token:
         headers["Authorization"] = f"token {token}"
-    
+
+    cache = cache if cache is not None else {}
+
+    try:
+        return _search_repos_with_prefix(user, prefix, headers, cache)
+    except Exception as e:
+        print(f"Warning: Search API unavailable, paging all repos: {e}", file=sys.stderr)
+
+    return _page_repos_with_prefix(user, prefix, headers, cache)
+
+
+def _search_repos_with_prefix(user: str, prefix: str, headers: Dict, cache: Dict) -> List[Repo]:
+    """Fetch matching repositories via the Search API (server-side filter)."""
+    url = f"{GITHUB_API_BASE}/search/repositories"
+    params = {"q": f"user:{user} {prefix} in:name", "per_page": 100}
+
+    key = _cache_key(url, params)
+    cached = cache.get(key)
+    if cached and cached.get("etag"):
+        headers = {**headers, "If-None-Match": cached["etag"]}
+
+    response = SESSION.get(url, headers=headers, params=params)
+
+    if response.status_code == 304 and cached:
+        payload = cached["body"]
+    else:
+        response.raise_for_status()
+        payload = _loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            cache[key] = {"etag": etag, "body": payload}
+
+    items = payload.get("items", [])
+    if payload.get("total_count", 0) > len(items):
+        raise RuntimeError("search results span multiple pages")
+
+    # The query matches anywhere in the name; keep the strict prefix filter
+    return [_repo_from_rest(repo) for repo in items if repo["name"].startswith(prefix)]
+
+
+def _page_repos_with_prefix(user: str, prefix: str, headers: Dict, cache: Dict) -> List[Repo]:
+    """Fetch matching repositories by paging through all user repos.
+
+    Page 1 reveals the total page count via the Link rel="last" header,
+    so any remaining pages are fetched concurrently instead of walking
+    them one round-trip at a time.
+    """
+    url = f"{GITHUB_API_BASE}/users/{user}/repos"
+
+    def fetch_page(page: int) -> tuple:
+        params = {"page": page, "per_page": 100, "type": "all"}
+        page_headers = dict(headers)
+
+        key = _cache_key(url, params)
+        cached = cache.get(key)
+        if cached and cached.get("etag"):
+            page_headers["If-None-Match"] = cached["etag"]
+
+        response = SESSION.get(url, headers=page_headers, params=params)
+
+        if response.status_code == 304 and cached:
+            return cached["body"], response
+
+        response.raise_for_status()
+        page_repos = _loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            cache[key] = {"etag": etag, "body": page_repos}
+        return page_repos, response
+
+    first_page, response = fetch_page(1)
+    pages = [first_page]
+
+    # Learn the total page count from the Link rel="last" header
+    last_url = response.links.get("last", {}).get("url", "")
+    match = re.search(r"[?&]page=(\d+)", last_url)
+    last_page = int(match.group(1)) if match else 1
+
+    if last_page > 1:
+        # Fan out the remaining pages concurrently and stitch in order
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            pages.extend(page_repos for page_repos, _ in
+                         executor.map(fetch_page, range(2, last_page + 1)))
+    elif len(first_page) == 100:
+        # No Link header (e.g. a 304 reply); walk pages sequentially
+        page = 2
+        while True:
+            page_repos, _ = fetch_page(page)
+            if not page_repos:
+                break
+            pages.append(page_repos)
+            if len(page_repos) < 100:
+                break
+            page += 1
+
     repos = []
-    page = 1
-    
+    for page_repos in pages:
+        # Filter repos with the prefix
+        repos.extend(_repo_from_rest(repo) for repo in page_repos
+                     if repo["name"].startswith(prefix))
+
+    return repos
+
+
+# GraphQL query fetching the repo list together with each repo's latest
+# release, collapsing 1 + N REST round-trips into a single request
+REPOS_QUERY = """
+query($login: String!, $cursor: String) {
+  user(login: $login) {
+    repositories(first: 100, ownerAffiliations: OWNER, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        description
+        url
+        primaryLanguage { name }
+        object(expression: "HEAD:Cargo.toml") { ... on Blob { byteSize } }
+        releases(first: 1, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { tagName publishedAt url }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def fetch_projects_graphql(user: str, prefix: str, token: str) -> List[Repo]:
+    """Fetch repositories matching the prefix, with their latest release,
+    in a single GraphQL query.
+
+    Returns Repo objects like the REST path, with latest_release already
+    populated where a release exists.
+    """
+    headers = {"Authorization": f"bearer {token}"}
+    url = f"{GITHUB_API_BASE}/graphql"
+
+    repos = []
+    cursor = None
+
     while True:
-        url = f"{GITHUB_API_BASE}/users/{user}/repos"
-        params = {"page": page, "per_page": 100, "type": "all"}
-        
-        response = requests.get(url, headers=headers, params=params)
+        response = SESSION.post(
+            url,
+            headers=headers,
+            json={"query": REPOS_QUERY, "variables": {"login": user, "cursor": cursor}},
+        )
         response.raise_for_status()
-        
-        page_repos = response.json()
-        if not page_repos:
-            break
-            
+
+        payload = _loads(response.content)
+        if payload.get("errors"):
+            raise RuntimeError(f"GraphQL query failed: {payload['errors']}")
+
+        repositories = payload["data"]["user"]["repositories"]
+
         # Filter repos with the prefix
-        filtered = [repo for repo in page_repos if repo["name"].startswith(prefix)]
-        repos.extend(filtered)
-        
-        page += 1
-        
-        # Break if we got less than 100 repos (last page)
-        if len(page_repos) < 100:
+        for node in repositories["nodes"]:
+            if not node["name"].startswith(prefix):
+                continue
+
+            language = node["primaryLanguage"]
+            repo = Repo(
+                name=node["name"],
+                description=node["description"],
+                html_url=node["url"],
+                language=language["name"] if language else None,
+                has_cargo_toml=node["object"] is not None,
+                release_prefetched=True,
+            )
+
+            releases = node["releases"]["nodes"]
+            if releases:
+                release = releases[0]
+                repo.latest_release = {
+                    "tag_name": release["tagName"],
+                    "published_at": release["publishedAt"],
+                    "html_url": release["url"],
+                }
+
+            repos.append(repo)
+
+        if not repositories["pageInfo"]["hasNextPage"]:
             break
-    
+        cursor = repositories["pageInfo"]["endCursor"]
+
     return repos
 
 
-def get_latest_release(owner: str, repo: str, token: Optional[str] = None) -> Optional[Dict]:
+def _retry_delay(status: int, headers, attempt: int) -> Optional[float]:
+    """Return how long to sleep before retrying, or None if not retryable.
+
+    Honors Retry-After on throttled responses and the X-RateLimit-Reset
+    epoch on GitHub secondary rate limits (403 with zero remaining);
+    otherwise uses exponential backoff with jitter.
+    """
+    if status in RETRYABLE_STATUSES:
+        retry_after = headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return RETRY_BACKOFF_FACTOR * (2 ** attempt) + random.uniform(0, 1)
+
+    if status == 403 and headers.get("x-ratelimit-remaining") == "0":
+        reset = headers.get("x-ratelimit-reset")
+        if reset and reset.isdigit():
+            return max(0.0, int(reset) - time.time()) + random.uniform(0, 1)
+
+    return None
+
+
+async def _get_json_cached(session: aiohttp.ClientSession, url: str,
+                           headers: Dict, cache: Dict) -> Optional[Dict]:
+    """GET a JSON resource, reusing the cached body on 304 Not Modified.
+
+    Transient failures and rate-limited responses are retried with
+    exponential backoff and jitter.
+    """
+    cached = cache.get(url)
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    for attempt in range(MAX_RETRIES + 1):
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                return cached["body"]
+            if response.status == 200:
+                body = _loads(await response.read())
+                etag = response.headers.get("ETag")
+                if etag:
+                    cache[url] = {"etag": etag, "body": body}
+                return body
+
+            delay = _retry_delay(response.status, response.headers, attempt)
+
+        if delay is None or attempt == MAX_RETRIES:
+            break
+        print(f"Rate limited or transient error on {url}, retrying in {delay:.1f}s...",
+              file=sys.stderr)
+        await asyncio.sleep(delay)
+
+    return None
+
+
+async def get_latest_release(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                             owner: str, repo: str, token: Optional[str] = None,
+                             cache: Optional[Dict] = None) -> Optional[Dict]:
     """Get the latest release for a repository."""
     headers = {"Accept": "application/vnd.github.v3+json"}
     if token:
         headers["Authorization"] = f"token {token}"
-    
+
     url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/latest"
-    
+
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()
+        async with semaphore:
+            return await _get_json_cached(session, url, headers, cache if cache is not None else {})
     except Exception as e:
         print(f"Error fetching release for {repo}: {e}", file=sys.stderr)
-    
+
     return None
 
 
-def get_crates_info(crate_name: str) -> Optional[Dict]:
+async def get_crates_info(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                          crate_name: str, cache: Optional[Dict] = None) -> Optional[Dict]:
     """Get information from crates.io for a crate."""
     url = f"{CRATES_API_BASE}/crates/{crate_name}"
     headers = {"User-Agent": "rustedbytes-page-generator"}
-    
+
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()
+        async with semaphore:
+            return await _get_json_cached(session, url, headers, cache if cache is not None else {})
     except Exception as e:
         print(f"Error fetching crate info for {crate_name}: {e}", file=sys.stderr)
-    
+
     return None
 
 
 def format_date(date_str: str) -> str:
     """Format ISO date string to a readable format."""
+    # GitHub timestamps are always YYYY-MM-DDTHH:MM:SSZ, so the date is
+    # just the first 10 characters; no need to parse and re-format
+    if date_str and len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+        return date_str[:10]
     try:
         dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
         return dt.strftime("%Y-%m-%d")
@@ -145,41 +531,76 @@ def format_date(date_str: str) -> str:
         return date_str
 
 
-def generate_markdown(projects: List[Dict], config: Dict) -> str:
-    """Generate Jekyll-compatible Markdown page from project data.
-    
-    Args:
-        projects: List of project data dictionaries
-        config: Page configuration dictionary
+# Markdown table row for a single project; percent-formatting of a
+# precompiled constant is cheaper than an f-string in the per-row loop
+PROJECT_ROW_TEMPLATE = "| [**%(name)s**](%(html_url)s) | %(description)s | %(release)s | %(crates)s |\n"
+
+# Page skeleton, compiled once at import time instead of re-parsing a
+# large f-string on every call (this is Markdown, so stdlib Template is
+# enough and avoids pulling in a template-engine dependency)
+PAGE_HEADER_TEMPLATE = Template("""---
+layout: $layout
+title: $page_title
+---
+
+$header
+
+$page_description
+
+---
+
+Welcome to the Rustedbytes project collection! This page provides an overview of all projects in the rustedbytes ecosystem, including their latest releases on GitHub and crates.io availability.
+
+Each project is built with Rust, focusing on performance, reliability, and developer experience.
+
+## Projects
+
+| Project | Description | Latest Release | Crates.io |
+|---------|-------------|----------------|-----------|
+""")
+
+PAGE_FOOTER_TEMPLATE = Template("""
+---
+
+*Generated from [@$user](https://github.com/$user) GitHub repositories*
+
+*Last updated: $last_updated*
+""")
+
+
+@dataclass(slots=True)
+class Row:
+    """Precomputed, render-ready cells for one project table row."""
+    name: str
+    html_url: str
+    description: str
+    release: str
+    crates: str
+
+
+def prepare_rows(projects: List[Dict]) -> List[Row]:
+    """Precompute sorted, render-ready rows from the project data.
+
+    The cell formatting and the sort by name happen once here, so every
+    output generator can consume the same row list without redoing the
+    work per format.
     """
-    
-    # Sort projects by name
-    projects = sorted(projects, key=lambda x: x["name"])
-    
-    # Extract styling configuration
-    styling = config.get("styling", {})
-    page_title = styling.get("page_title", "Rustedbytes Projects")
-    page_description = styling.get("page_description", "A collection of Rust-based projects")
-    header_emoji = styling.get("header_emoji", "🦀")
-    layout = config.get("layout", "default")
-    
-    # Generate project rows in Markdown table format
-    project_rows = []
-    for project in projects:
+    rows = []
+    for project in sorted(projects, key=lambda x: x["name"]):
         name = project["name"]
         description = project.get("description", "No description available")
         html_url = project["html_url"]
-        
+
         # Latest GitHub release
         github_release = project.get("latest_release")
         if github_release:
             release_tag = github_release.get("tag_name", "N/A")
             release_date = format_date(github_release.get("published_at", ""))
             release_url = github_release.get("html_url", html_url)
-            github_release_cell = f'[{release_tag}]({release_url}) ({release_date})'
+            release_cell = f'[{release_tag}]({release_url}) ({release_date})'
         else:
-            github_release_cell = '_No releases_'
-        
+            release_cell = '_No releases_'
+
         # Crates.io info
         crates_info = project.get("crates_info")
         if crates_info:
@@ -190,100 +611,189 @@ def generate_markdown(projects: List[Dict], config: Dict) -> str:
             crates_cell = f'[{latest_version}]({crates_url})'
         else:
             crates_cell = '_Not published_'
-        
+
         # Escape pipe characters in description to avoid breaking table
         description = description.replace("|", "\\|") if description else "No description available"
-        
-        project_rows.append(f'| [**{name}**]({html_url}) | {description} | {github_release_cell} | {crates_cell} |')
-    
-    projects_table = "\n".join(project_rows)
-    
+
+        rows.append(Row(name, html_url, description, release_cell, crates_cell))
+
+    return rows
+
+
+def write_markdown(rows: List[Row], config: Dict, fp) -> None:
+    """Stream the Jekyll-compatible Markdown page to an open file object.
+
+    Writing header, rows and footer straight to the destination keeps
+    memory O(1) in the number of projects instead of materializing the
+    whole page as an intermediate string.
+
+    Args:
+        rows: Render-ready rows from prepare_rows()
+        config: Page configuration dictionary
+        fp: Writable text file object
+    """
+
+    # Extract styling configuration
+    styling = config.get("styling", {})
+    page_title = styling.get("page_title", "Rustedbytes Projects")
+    page_description = styling.get("page_description", "A collection of Rust-based projects")
+    header_emoji = styling.get("header_emoji", "🦀")
+    layout = config.get("layout", "default")
+
     # Build header with optional emoji
     header = f"# {header_emoji} {page_title}" if header_emoji else f"# {page_title}"
-    
-    # Generate Jekyll front matter and Markdown content
-    markdown = f"""---
-layout: {layout}
-title: {page_title}
----
 
-{header}
+    # Compute the timestamp once rather than inside the footer template
+    last_updated = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
 
-{page_description}
+    # Jekyll front matter and page header
+    fp.write(PAGE_HEADER_TEMPLATE.substitute(
+        layout=layout,
+        page_title=page_title,
+        header=header,
+        page_description=page_description,
+    ))
 
----
+    # Project rows in Markdown table format
+    for row in rows:
+        fp.write(PROJECT_ROW_TEMPLATE % {
+            "name": row.name,
+            "html_url": row.html_url,
+            "description": row.description,
+            "release": row.release,
+            "crates": row.crates,
+        })
 
-Welcome to the Rustedbytes project collection! This page provides an overview of all projects in the rustedbytes ecosystem, including their latest releases on GitHub and crates.io availability.
+    # Page footer
+    fp.write(PAGE_FOOTER_TEMPLATE.substitute(user=GITHUB_USER, last_updated=last_updated))
 
-Each project is built with Rust, focusing on performance, reliability, and developer experience.
 
-## Projects
+def generate_markdown(rows: List[Row], config: Dict) -> str:
+    """Generate the Markdown page as a string (see write_markdown)."""
+    buf = io.StringIO()
+    write_markdown(rows, config, buf)
+    return buf.getvalue()
 
-| Project | Description | Latest Release | Crates.io |
-|---------|-------------|----------------|-----------|
-{projects_table}
 
----
+async def enrich_projects(repos: List[Repo], token: Optional[str] = None,
+                          cache: Optional[Dict] = None) -> List[Dict]:
+    """Enrich repositories with release and crates.io information concurrently."""
+    github_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    crates_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CRATES_REQUESTS)
 
-*Generated from [@{GITHUB_USER}](https://github.com/{GITHUB_USER}) GitHub repositories*
+    async def _resolved(value):
+        return value
 
-*Last updated: {datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")}*
-"""
-    return markdown
+    def _might_be_crate(repo: Repo) -> bool:
+        # Skip crates.io probes for repos whose GitHub metadata proves
+        # they cannot be crates; unknown metadata means "maybe"
+        if repo.language is not None and repo.language != "Rust":
+            return False
+        if repo.has_cargo_toml is False:
+            return False
+        return True
+
+    async with aiohttp.ClientSession(headers={"Accept-Encoding": ACCEPT_ENCODING}) as session:
+        # Dispatch all release + crate lookups concurrently; repos coming
+        # from the GraphQL path already carry their latest release
+        tasks = []
+        for repo in repos:
+            if repo.release_prefetched:
+                release_task = _resolved(repo.latest_release)
+            else:
+                release_task = get_latest_release(
+                    session, github_semaphore, GITHUB_USER, repo.name, token, cache)
+            if _might_be_crate(repo):
+                crates_task = get_crates_info(session, crates_semaphore, repo.name, cache)
+            else:
+                crates_task = _resolved(None)
+            tasks.append(asyncio.gather(release_task, crates_task))
+        results = await asyncio.gather(*tasks)
+
+    projects = []
+    for repo, (latest_release, crates_info) in zip(repos, results):
+        print(f"Processing {repo.name}...")
+
+        project_data = {
+            "name": repo.name,
+            "description": repo.description,
+            "html_url": repo.html_url,
+        }
+
+        if latest_release:
+            project_data["latest_release"] = latest_release
+
+        if crates_info:
+            project_data["crates_info"] = crates_info
+
+        projects.append(project_data)
+
+    return projects
 
 
 def main():
     """Main function to generate the static page."""
     print("Starting page generation...")
-    
+
     # Load page configuration
     print("Loading page configuration...")
     config = load_page_config()
     print(f"Using layout: {config.get('layout')}")
     print(f"Using theme: {config.get('theme')}")
-    
+
     # Get GitHub token
     token = get_github_token()
     if not token:
         print("Warning: No GITHUB_TOKEN found. API rate limits may apply.", file=sys.stderr)
-    
-    # Fetch repositories
+
+    # Load the HTTP response cache so unchanged endpoints answer with
+    # cheap 304 responses instead of full payloads
+    cache = load_http_cache()
+
+    # Fetch repositories (GraphQL batches the repo list and all latest
+    # releases into one request; REST is the tokenless fallback)
     print(f"Fetching repositories for user '{GITHUB_USER}' with prefix '{REPO_PREFIX}'...")
-    repos = fetch_repos_with_prefix(GITHUB_USER, REPO_PREFIX, token)
+    repos = None
+    if token:
+        try:
+            repos = fetch_projects_graphql(GITHUB_USER, REPO_PREFIX, token)
+        except Exception as e:
+            print(f"Warning: GraphQL fetch failed, falling back to REST: {e}", file=sys.stderr)
+    if repos is None:
+        repos = fetch_repos_with_prefix(GITHUB_USER, REPO_PREFIX, token, cache)
     print(f"Found {len(repos)} repositories")
-    
-    # Enrich with release and crates.io information
-    projects = []
-    for repo in repos:
-        print(f"Processing {repo['name']}...")
-        
-        project_data = {
-            "name": repo["name"],
-            "description": repo["description"],
-            "html_url": repo["html_url"],
-        }
-        
-        # Get latest release
-        latest_release = get_latest_release(GITHUB_USER, repo["name"], token)
-        if latest_release:
-            project_data["latest_release"] = latest_release
-        
-        # Try to get crates.io info (use repo name as crate name)
-        crates_info = get_crates_info(repo["name"])
-        if crates_info:
-            project_data["crates_info"] = crates_info
-        
-        projects.append(project_data)
-    
+
+    # Enrich with release and crates.io information (concurrently)
+    projects = asyncio.run(enrich_projects(repos, token, cache))
+
+    # Persist the cache for the next run
+    save_http_cache(cache)
+
+    output_path = "index.md"
+
+    # Skip regeneration when the enriched data is identical to the last
+    # run; the digest covers the project data only, so the "Last updated"
+    # timestamp cannot cause churn on its own
+    digest = hashlib.sha256(
+        json.dumps(projects, sort_keys=True, default=str).encode()).hexdigest()
+    if digest == _read_last_hash() and os.path.exists(output_path):
+        print("No upstream changes detected; skipping page regeneration.")
+        return
+
     # Generate Markdown
     print("Generating Markdown...")
-    markdown = generate_markdown(projects, config)
-    
-    # Write to file
-    output_path = "index.md"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(markdown)
-    
+    rows = prepare_rows(projects)
+
+    # Stream the page straight into a temp file in the same directory,
+    # then publish it atomically so a crash mid-write can never truncate
+    # the live page
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        write_markdown(rows, config, f)
+    os.replace(tmp_path, output_path)
+
+    _write_last_hash(digest)
+
     print(f"Page generated successfully: {output_path}")
     print(f"Total projects: {len(projects)}")
     print(f"Layout used: {config.get('layout')}")